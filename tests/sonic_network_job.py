@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+pyATS Easypy job for the SONiC network topology tests
+
+Runs tests/sonic_network_test.py against the testbed. Job-specific options
+are passed after the standard easypy arguments:
+
+    pyats run job tests/sonic_network_job.py --testbed-yaml testbed.yaml
+    pyats run job tests/sonic_network_job.py --testbed-yaml testbed.yaml --modes bash
+"""
+import argparse
+import os
+
+from pyats.easypy import run
+from pyats.topology import loader
+
+TESTSCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sonic_network_test.py')
+
+# Mirrors CONNECTIVITY_MODES in the test script; kept here so the job doesn't
+# import the test module into the Easypy process
+CONNECTIVITY_MODES = ('vtysh', 'bash')
+
+
+def main(runtime):
+    """Easypy entry point"""
+    parser = argparse.ArgumentParser(description='SONiC Network Test Job')
+    parser.add_argument('--testbed-yaml',
+                       help='Path to testbed YAML file',
+                       default='testbed.yaml')
+    parser.add_argument('--modes', nargs='+',
+                       choices=CONNECTIVITY_MODES,
+                       help='Connection types to test (default: all)',
+                       default=list(CONNECTIVITY_MODES))
+
+    # Easypy leaves job-specific arguments in sys.argv
+    args, _ = parser.parse_known_args()
+
+    # A testbed given through easypy's own --testbed-file takes precedence
+    testbed = runtime.testbed or loader.load(args.testbed_yaml)
+
+    run(testscript=TESTSCRIPT, runtime=runtime, testbed=testbed, modes=args.modes)
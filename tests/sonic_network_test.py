@@ -3,130 +3,350 @@
 Sample pyATS test script for SONiC network topology testing
 
 This script demonstrates basic connectivity testing for the SONiC network
-topology using pyATS fram                # Execute ping command from source to destination
-                # Exit vtysh to run system ping, then re-enter
-                source_device.execute('exit')  # Exit vtysh
-                ping_command = f"ping -c 3 -W 2 {dst_ip}"
-                logger.info(f"  Executing: {ping_command}")
-                
-                try:
-                    ping_output = source_device.execute(ping_command)
-                    source_device.execute('vtysh')  # Re-enter vtysh
-                    
-                    # Check if ping was successful (look for "3 received" or "0% packet loss")
-                    if "3 received" in ping_output or "0% packet loss" in ping_output:"
+topology using pyATS framework.
 """
 import logging
-import yaml
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pyats import aetest
 from pyats.log.utils import banner
-from pyats.topology import Testbed, loader
+
+if TYPE_CHECKING:
+    from pyats.topology import Testbed
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Global testbed object - will be initialized before tests run
-global_testbed = None
+@dataclass
+class TestContext:
+    """Shared state populated by CommonSetup and read by the testcases"""
+    # Not a pytest test class, despite the name and this module's *_test.py name
+    __test__ = False
+    
+    testbed: Optional['Testbed'] = None
+    # (name, device) pairs snapshotted from testbed.devices in load_testbed
+    devices: tuple = ()
+    # (name, device, connection keys, type, os) snapshot taken in load_testbed
+    device_info: list = field(default_factory=list)
+    # Resolved operation timeouts, see DEFAULT_TIMEOUTS
+    timeouts: dict = field(default_factory=dict)
+
+
+@dataclass
+class PingResult:
+    """Outcome of pinging one destination IP from one device"""
+    src: str
+    src_ip: str
+    dst: str
+    dst_ip: str
+    ok: bool
+    detail: str
+    
+    @property
+    def path(self):
+        return f"{self.src} ({self.src_ip}) -> {self.dst} ({self.dst_ip})"
+
+
+# Test context - will be initialized before tests run
+CTX = TestContext()
+
+# Connection types that can be exercised; select a subset with --modes
+CONNECTIVITY_MODES = ('vtysh', 'bash')
+
+# Script parameters - overridable through aetest.main()/easypy run() kwargs
+parameters = {
+    'modes': list(CONNECTIVITY_MODES),
+}
+
+# Data interface connectivity map based on docker-compose networks
+DATA_LINKS = [
+    # Direct neighbor connectivity tests
+    ('sonic-1', '192.1.2.11', 'sonic-2', '192.1.2.12'),  # link_1_2
+    ('sonic-2', '192.2.3.12', 'sonic-3', '192.2.3.13'),  # link_2_3
+    ('sonic-3', '192.3.4.13', 'sonic-4', '192.3.4.14'),  # link_3_4
+    ('sonic-1', '192.1.5.11', 'sonic-5', '192.1.5.15'),  # link_1_5
+    ('sonic-5', '192.5.6.15', 'sonic-6', '192.5.6.16'),  # link_5_6
+    ('sonic-6', '192.4.6.16', 'sonic-4', '192.4.6.14'),  # link_6_4
+]
+
+
+def _build_ping_targets(links):
+    """Reshape the link list into {device: [(src_ip, dst_ip, dst_device), ...]}
+
+    Every link is pinged in both directions, so each endpoint gets its peer
+    as a target; grouping by source lets a device probe all its peers in a
+    single batch.
+    """
+    targets = defaultdict(list)
+    for src_device, src_ip, dst_device, dst_ip in links:
+        targets[src_device].append((src_ip, dst_ip, dst_device))
+        targets[dst_device].append((dst_ip, src_ip, src_device))
+    return dict(targets)
+
+
+PING_TARGETS = _build_ping_targets(DATA_LINKS)
+
+# Per-target summary line printed by `fping -c1 -q`, e.g.
+#   192.1.2.12 : xmt/rcv/%loss = 1/1/0%, min/avg/max = 0.05/0.05/0.05
+_FPING_RESULT = re.compile(r"^(\S+)\s+:\s+xmt/rcv/%loss = (\d+)/(\d+)/", re.M)
+
+# Sent/received/loss counts from the `ping` summary line, e.g.
+#   1 packets transmitted, 1 received, 0% packet loss, time 0ms
+_PING_SUMMARY = re.compile(r"(\d+) packets transmitted, (\d+) received.*?(\d+)% packet loss", re.S)
+
+# Default timeouts (seconds) per operation; override under `custom: timeouts:`
+# in the testbed YAML, either testbed-wide or per device
+DEFAULT_TIMEOUTS = {
+    'connect': 30,
+    'exec_fast': 15,
+    'exec_ping': 5,
+}
+
+# Upper bound on concurrent device sessions opened by the connection tests
+MAX_CONNECT_WORKERS = 32
+
+
+def _get_timeout(device, operation):
+    """Return the timeout for an operation, preferring the device's own override"""
+    device_timeouts = device.custom.get('timeouts', {})
+    if operation in device_timeouts:
+        return device_timeouts[operation]
+    return CTX.timeouts[operation]
+
+
+def cached_show_version(device):
+    """Return the device's 'show version' output, executing it only on first use
+
+    The VTYsh connection test already runs the command, so tests needing
+    version data get it without another round-trip. That test disconnects
+    afterwards, so on a cache miss the default connection is opened just for
+    the command and closed again. CommonCleanup clears the cache.
+    """
+    output = getattr(device, '_cached_show_version', None)
+    if output is None:
+        connect_here = not device.is_connected()
+        if connect_here:
+            device.connect(via='default', connection_timeout=_get_timeout(device, 'connect'))
+        try:
+            output = device.execute('show version', timeout=_get_timeout(device, 'exec_fast'))
+        finally:
+            if connect_here:
+                device.disconnect()
+        device._cached_show_version = output
+    return output
+
+
+def _parse_ping_summary(ping_output):
+    """Return (sent, received, loss %) from ping output, or None if there is no summary"""
+    match = _PING_SUMMARY.search(ping_output)
+    if not match:
+        return None
+    return tuple(int(value) for value in match.groups())
+
+
+def _probe_devices(probe, devices):
+    """Run a per-device probe concurrently and collect (name, success, msg) tuples
+
+    Connection setup is dominated by SSH/telnet handshakes, so running the
+    probes in a thread pool makes the total time roughly that of the slowest
+    device instead of the sum over all devices.
+    """
+    devices = list(devices)
+    if not devices:
+        return []
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=min(MAX_CONNECT_WORKERS, len(devices))) as executor:
+        futures = {executor.submit(probe, name, device): name for name, device in devices}
+        for future in as_completed(futures):
+            device_name = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Probes catch their own errors; this only guards against surprises
+                results.append((device_name, False, str(e)))
+    return results
+
+
+def _probe_vtysh(device_name, device):
+    """Connect via vtysh, run a command and disconnect - returns (name, success, msg)"""
+    logger.info("Testing VTYsh connection to %s", device_name)
+    
+    try:
+        # 1. Connect to the device using default (vtysh) connection
+        logger.info("  Connecting to %s with VTYsh...", device_name)
+        device.connect(via='default', connection_timeout=_get_timeout(device, 'connect'))
+        
+        # 2. Verify connection is established
+        if device.connected:
+            logger.info("  ✓ Successfully connected to %s via VTYsh", device_name)
+        else:
+            raise Exception(f"VTYsh connection failed to {device_name}")
+        
+        # 3. Test VTYsh command execution
+        logger.info("  Testing VTYsh command execution on %s...", device_name)
+        try:
+            # Execute a VTYsh command to verify device responsiveness
+            output = device.execute('show version', timeout=_get_timeout(device, 'exec_fast'))
+            # Keep the output so later tests can use cached_show_version()
+            device._cached_show_version = output
+            logger.info("  ✓ VTYsh command execution successful on %s", device_name)
+            logger.info("  Command output length: %s characters", len(output))
+        except Exception as cmd_error:
+            logger.warning("  ⚠ VTYsh command execution failed on %s: %s", device_name, cmd_error)
+            # Don't fail the test for command issues, just log it
+        
+        # 4. Disconnect from the device - disconnect() is synchronous, so the
+        #    connection state only needs checking when it raises
+        logger.info("  Disconnecting from %s...", device_name)
+        try:
+            device.disconnect()
+        except Exception as disconnect_error:
+            if device.connected:
+                raise Exception(f"VTYsh disconnect failed for {device_name}: {disconnect_error}")
+        
+        logger.info("  ✓ Successfully disconnected from %s", device_name)
+        return (device_name, True, "VTYsh Success")
+            
+    except Exception as e:
+        logger.error("  ✗ VTYsh connection test failed for %s: %s", device_name, e)
+        return (device_name, False, str(e))
+
+
+def _probe_bash(device_name, device):
+    """Connect via bash, run commands and disconnect - returns (name, success, msg)"""
+    logger.info("Testing Bash connection to %s", device_name)
+    
+    try:
+        # 1. Connect to the device using bash connection with alias
+        logger.info("  Connecting to %s with Bash...", device_name)
+        device.connect(via='bash', alias='bash_conn', connection_timeout=_get_timeout(device, 'connect'))
+        
+        # 2. Verify connection is established
+        if device.bash_conn.connected:
+            logger.info("  ✓ Successfully connected to %s via Bash", device_name)
+        else:
+            raise Exception(f"Bash connection failed to {device_name}")
+        
+        # 3. Test bash command execution
+        logger.info("  Testing Bash command execution on %s...", device_name)
+        try:
+            # Execute basic bash commands to verify device responsiveness
+            output = device.bash_conn.execute('whoami', timeout=_get_timeout(device, 'exec_fast'))
+            logger.info("  ✓ Bash command execution successful on %s", device_name)
+            logger.info("  Current user: %s", output.strip())
+            
+            # Test another bash command
+            hostname_output = device.bash_conn.execute('hostname', timeout=_get_timeout(device, 'exec_fast'))
+            logger.info("  Device hostname: %s", hostname_output.strip())
+            
+        except Exception as cmd_error:
+            logger.warning("  ⚠ Bash command execution failed on %s: %s", device_name, cmd_error)
+            # Don't fail the test for command issues, just log it
+        
+        # 4. Disconnect from the device - disconnect() is synchronous, so the
+        #    connection state only needs checking when it raises
+        logger.info("  Disconnecting from %s...", device_name)
+        try:
+            device.bash_conn.disconnect()
+        except Exception as disconnect_error:
+            if device.bash_conn.connected:
+                raise Exception(f"Bash disconnect failed for {device_name}: {disconnect_error}")
+        
+        logger.info("  ✓ Successfully disconnected from %s", device_name)
+        return (device_name, True, "Bash Success")
+            
+    except Exception as e:
+        logger.error("  ✗ Bash connection test failed for %s: %s", device_name, e)
+        return (device_name, False, str(e))
+
+
+# Shell commands always go over the dedicated bash connection (bash_conn) so the
+# default connection can stay inside vtysh for FRR CLI - no exit/re-enter needed
+def _connect_bash(device_name, device):
+    """Open a persistent bash session aliased as bash_conn - returns (name, success, msg)"""
+    try:
+        device.connect(via='bash', alias='bash_conn', connection_timeout=_get_timeout(device, 'connect'))
+        if not device.bash_conn.connected:
+            raise Exception(f"Bash connection failed to {device_name}")
+        logger.info("  ✓ Connected to %s via bash", device_name)
+        return (device_name, True, "Bash connected")
+    except Exception as e:
+        logger.error("  ✗ Bash connection failed for %s: %s", device_name, e)
+        return (device_name, False, str(e))
+
 
 class CommonSetup(aetest.CommonSetup):
     """Common setup tasks for all test cases"""
     
     @aetest.subsection
     def load_testbed(self, testbed):
-        """Store the testbed object globally for all test methods"""
-        global global_testbed
+        """Store the testbed object in the shared test context"""
+        logger.info(banner("Setting up test context"))
         
-        logger.info(banner("Setting up global testbed object"))
+        CTX.testbed = testbed
+        CTX.devices = tuple(testbed.devices.items())
         
-        # Store testbed globally
-        global_testbed = testbed
+        # Operation timeouts: built-in defaults overridden by testbed custom data
+        CTX.timeouts = {**DEFAULT_TIMEOUTS, **testbed.custom.get('timeouts', {})}
+        
+        # Snapshot per-device attributes once so later subsections don't walk
+        # the device/connection dicts again
+        CTX.device_info = [
+            (device_name, device, tuple(device.connections.keys()), device.type, device.os)
+            for device_name, device in CTX.devices
+        ]
         
-        logger.info(f"Testbed available with {len(testbed.devices)} devices")
-        for device_name, device in testbed.devices.items():
-            logger.info(f"  Device: {device_name} ({device.os})")
+        logger.info("Testbed available with %s devices", len(testbed.devices))
+        if logger.isEnabledFor(logging.INFO):
+            for device_name, device, conn_keys, device_type, device_os in CTX.device_info:
+                logger.info("  Device: %s (%s)", device_name, device_os)
             
         self.passed(f"Testbed setup complete - {len(testbed.devices)} devices available")
     
     @aetest.subsection
     def check_topology(self):
         """Check if testbed is properly defined"""
-        global global_testbed
-        
         logger.info(banner("Checking testbed topology"))
         
         # Verify testbed is loaded
-        assert global_testbed is not None, "Testbed not loaded"
-        assert global_testbed.devices, "No devices found in testbed"
+        assert CTX.testbed is not None, "Testbed not loaded"
+        assert CTX.testbed.devices, "No devices found in testbed"
         
         # Log available devices
-        for device_name, device in global_testbed.devices.items():
-            logger.info(f"Found device: {device_name}")
-            logger.info(f"  Type: {device.type}")
-            logger.info(f"  OS: {device.os}")
-            logger.info(f"  Connections: {list(device.connections.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            for device_name, device, conn_keys, device_type, device_os in CTX.device_info:
+                logger.info("Found device: %s", device_name)
+                logger.info("  Type: %s", device_type)
+                logger.info("  OS: %s", device_os)
+                logger.info("  Connections: %s", list(conn_keys))
             
-        self.passed(f"Testbed validation passed - found {len(global_testbed.devices)} devices")
+        self.passed(f"Testbed validation passed - found {len(CTX.testbed.devices)} devices")
     
     @aetest.subsection
-    def test_vtysh_connections(self):
+    def test_vtysh_connections(self, modes):
         """Test connecting to all devices using vtysh (default connection)"""
-        global global_testbed
+        if 'vtysh' not in modes:
+            self.skipped("vtysh mode not selected")
         
         logger.info(banner("Testing VTYsh connections"))
         
         # Verify testbed is available
-        assert global_testbed is not None, "Testbed not loaded"
-        
-        connection_results = []
+        assert CTX.testbed is not None, "Testbed not loaded"
         
-        for device_name, device in global_testbed.devices.items():
-            logger.info(f"Testing VTYsh connection to {device_name}")
-            
-            try:
-                # 1. Connect to the device using default (vtysh) connection
-                logger.info(f"  Connecting to {device_name} with VTYsh...")
-                device.connect(via='default')
-                
-                # 2. Verify connection is established
-                if device.connected:
-                    logger.info(f"  ✓ Successfully connected to {device_name} via VTYsh")
-                else:
-                    raise Exception(f"VTYsh connection failed to {device_name}")
-                
-                # 3. Test VTYsh command execution
-                logger.info(f"  Testing VTYsh command execution...")
-                try:
-                    # Execute a VTYsh command to verify device responsiveness
-                    output = device.execute('show version')
-                    logger.info(f"  ✓ VTYsh command execution successful on {device_name}")
-                    logger.info(f"  Command output length: {len(output)} characters")
-                except Exception as cmd_error:
-                    logger.warning(f"  ⚠ VTYsh command execution failed on {device_name}: {cmd_error}")
-                    # Don't fail the test for command issues, just log it
-                
-                # 4. Disconnect from the device
-                logger.info(f"  Disconnecting from {device_name}...")
-                device.disconnect()
-                
-                # 5. Verify connection is properly closed
-                if not device.connected:
-                    logger.info(f"  ✓ Successfully disconnected from {device_name}")
-                    connection_results.append((device_name, True, "VTYsh Success"))
-                else:
-                    raise Exception(f"VTYsh disconnect failed for {device_name}")
-                    
-            except Exception as e:
-                logger.error(f"  ✗ VTYsh connection test failed for {device_name}: {str(e)}")
-                connection_results.append((device_name, False, str(e)))
+        connection_results = _probe_devices(_probe_vtysh, CTX.devices)
         
         # Evaluate overall results
         failed_devices = [name for name, success, msg in connection_results if not success]
         successful_devices = [name for name, success, msg in connection_results if success]
         
-        logger.info(f"VTYsh connection test summary:")
-        logger.info(f"  ✓ Successful: {len(successful_devices)} devices: {', '.join(successful_devices)}")
+        logger.info("VTYsh connection test summary:")
+        logger.info("  ✓ Successful: %s devices: %s", len(successful_devices), ', '.join(successful_devices))
         if failed_devices:
-            logger.error(f"  ✗ Failed: {len(failed_devices)} devices: {', '.join(failed_devices)}")
+            logger.error("  ✗ Failed: %s devices: %s", len(failed_devices), ', '.join(failed_devices))
         
         if failed_devices:
             self.failed(f"VTYsh connection tests failed for {len(failed_devices)} devices: {', '.join(failed_devices)}")
@@ -134,183 +354,166 @@ class CommonSetup(aetest.CommonSetup):
             self.passed(f"All {len(successful_devices)} VTYsh device connection tests passed")
 
     @aetest.subsection
-    def test_bash_connections(self):
+    def test_bash_connections(self, modes):
         """Test connecting to all devices using bash connection"""
-        global global_testbed
+        if 'bash' not in modes:
+            self.skipped("bash mode not selected")
         
         logger.info(banner("Testing Bash connections"))
         
         # Verify testbed is available
-        assert global_testbed is not None, "Testbed not loaded"
+        assert CTX.testbed is not None, "Testbed not loaded"
         
-        connection_results = []
-        
-        for device_name, device in global_testbed.devices.items():
-            logger.info(f"Testing Bash connection to {device_name}")
-            
-            try:
-                # 1. Connect to the device using bash connection with alias
-                logger.info(f"  Connecting to {device_name} with Bash...")
-                device.connect(via='bash', alias='bash_conn')
-                
-                # 2. Verify connection is established
-                if device.bash_conn.connected:
-                    logger.info(f"  ✓ Successfully connected to {device_name} via Bash")
-                else:
-                    raise Exception(f"Bash connection failed to {device_name}")
-                
-                # 3. Test bash command execution
-                logger.info(f"  Testing Bash command execution...")
-                try:
-                    # Execute basic bash commands to verify device responsiveness
-                    output = device.bash_conn.execute('whoami')
-                    logger.info(f"  ✓ Bash command execution successful on {device_name}")
-                    logger.info(f"  Current user: {output.strip()}")
-                    
-                    # Test another bash command
-                    hostname_output = device.bash_conn.execute('hostname')
-                    logger.info(f"  Device hostname: {hostname_output.strip()}")
-                    
-                except Exception as cmd_error:
-                    logger.warning(f"  ⚠ Bash command execution failed on {device_name}: {cmd_error}")
-                    # Don't fail the test for command issues, just log it
-                
-                # 4. Disconnect from the device
-                logger.info(f"  Disconnecting from {device_name}...")
-                device.bash_conn.disconnect()
-                
-                # 5. Verify connection is properly closed
-                if not device.bash_conn.connected:
-                    logger.info(f"  ✓ Successfully disconnected from {device_name}")
-                    connection_results.append((device_name, True, "Bash Success"))
-                else:
-                    raise Exception(f"Bash disconnect failed for {device_name}")
-                    
-            except Exception as e:
-                logger.error(f"  ✗ Bash connection test failed for {device_name}: {str(e)}")
-                connection_results.append((device_name, False, str(e)))
+        connection_results = _probe_devices(_probe_bash, CTX.devices)
         
         # Evaluate overall results
         failed_devices = [name for name, success, msg in connection_results if not success]
         successful_devices = [name for name, success, msg in connection_results if success]
         
-        logger.info(f"Bash connection test summary:")
-        logger.info(f"  ✓ Successful: {len(successful_devices)} devices: {', '.join(successful_devices)}")
+        logger.info("Bash connection test summary:")
+        logger.info("  ✓ Successful: %s devices: %s", len(successful_devices), ', '.join(successful_devices))
         if failed_devices:
-            logger.error(f"  ✗ Failed: {len(failed_devices)} devices: {', '.join(failed_devices)}")
+            logger.error("  ✗ Failed: %s devices: %s", len(failed_devices), ', '.join(failed_devices))
         
         if failed_devices:
             self.failed(f"Bash connection tests failed for {len(failed_devices)} devices: {', '.join(failed_devices)}")
         else:
             self.passed(f"All {len(successful_devices)} Bash device connection tests passed")
 
+
 class SonicBashPingTest(aetest.Testcase):
     """Test cases for SONiC network ping using bash only"""
     
     @aetest.setup
-    def setup(self):
-        """Setup for bash ping tests"""
-        global global_testbed
-        self.testbed = global_testbed
-        assert self.testbed is not None, "Global testbed not available"
+    def setup(self, modes):
+        """Setup for bash ping tests - open one bash session per link endpoint"""
+        if 'bash' not in modes:
+            # A skipped setup doesn't stop the tests; they check modes themselves
+            self.skipped("bash mode not selected")
+        
+        self.testbed = CTX.testbed
+        assert self.testbed is not None, "Testbed not available"
+        
+        # Every device appearing in a data link needs a bash session; open each
+        # one once up front instead of reconnecting per link
+        devices = [(name, self.testbed.devices[name]) for name in sorted(PING_TARGETS)]
+        
+        logger.info("Opening bash connections to %s devices...", len(devices))
+        connection_results = _probe_devices(_connect_bash, devices)
+        
+        failed_devices = [name for name, success, msg in connection_results if not success]
+        self._bash_devices = {
+            name: self.testbed.devices[name]
+            for name, success, msg in connection_results if success
+        }
+        
+        if failed_devices:
+            # Links touching these devices will be reported as failed by the test
+            logger.error("  ✗ Bash connection setup failed for %s devices: %s", len(failed_devices), ', '.join(failed_devices))
         
     @aetest.test
-    def test_bash_ping_connectivity(self):
+    def test_bash_ping_connectivity(self, modes):
         """Test network connectivity using bash ping commands only"""
-        logger.info(banner("Testing network connectivity using Bash ping"))
+        if 'bash' not in modes:
+            self.skipped("bash mode not selected")
         
-        # Define data interface connectivity map based on docker-compose networks
-        data_links = [
-            # Direct neighbor connectivity tests
-            ('sonic-1', '192.1.2.11', 'sonic-2', '192.1.2.12'),  # link_1_2
-            ('sonic-2', '192.2.3.12', 'sonic-3', '192.2.3.13'),  # link_2_3
-            ('sonic-3', '192.3.4.13', 'sonic-4', '192.3.4.14'),  # link_3_4
-            ('sonic-1', '192.1.5.11', 'sonic-5', '192.1.5.15'),  # link_1_5
-            ('sonic-5', '192.5.6.15', 'sonic-6', '192.5.6.16'),  # link_5_6
-            ('sonic-6', '192.4.6.16', 'sonic-4', '192.4.6.14'),  # link_6_4
-        ]
+        logger.info(banner("Testing network connectivity using Bash ping"))
         
-        ping_test_passed = True
+        # Devices are independent, so run one batch per source device concurrently
+        with ThreadPoolExecutor(max_workers=len(PING_TARGETS)) as executor:
+            batches = list(executor.map(self._ping_targets, PING_TARGETS.keys(), PING_TARGETS.values()))
+        results = [result for batch in batches for result in batch]
         
-        for src_device, src_ip, dst_device, dst_ip in data_links:
-            logger.info(f"Testing bash ping: {src_device} ({src_ip}) -> {dst_device} ({dst_ip})")
-            
-            try:
-                # Get source device object
-                source_device = self.testbed.devices[src_device]
-                
-                # Connect to source device using bash connection with alias
-                if not hasattr(source_device, 'bash_conn') or not source_device.bash_conn.connected:
-                    logger.info(f"  Connecting to {src_device} via bash...")
-                    source_device.connect(via='bash', alias='bash_conn')
-                
-                # Execute ping command using bash connection
-                ping_command = f"ping -c 3 -W 2 {dst_ip}"
-                logger.info(f"  Executing bash command: {ping_command}")
-                
-                try:
-                    ping_output = source_device.bash_conn.execute(ping_command, timeout=10)
-                    
-                    # Check if ping was successful (look for "3 received" or "0% packet loss")
-                    if "3 received" in ping_output or "0% packet loss" in ping_output:
-                        logger.info(f"  ✓ Bash ping successful: {src_device} -> {dst_device}")
-                    else:
-                        logger.error(f"  ✗ Bash ping failed: {src_device} -> {dst_device}")
-                        logger.error(f"  Ping output: {ping_output}")
-                        ping_test_passed = False
-                        
-                except Exception as ping_error:
-                    logger.error(f"  ✗ Bash ping command failed: {src_device} -> {dst_device}: {ping_error}")
-                    ping_test_passed = False
-                
-                # Test bidirectional connectivity (reverse direction)
-                logger.info(f"Testing reverse bash ping: {dst_device} ({dst_ip}) -> {src_device} ({src_ip})")
-                
-                try:
-                    # Get destination device object
-                    dest_device = self.testbed.devices[dst_device]
-                    
-                    # Connect to destination device using bash connection with alias
-                    if not hasattr(dest_device, 'bash_conn') or not dest_device.bash_conn.connected:
-                        logger.info(f"  Connecting to {dst_device} via bash...")
-                        dest_device.connect(via='bash', alias='bash_conn')
-                    
-                    # Execute reverse ping command using bash connection
-                    reverse_ping_command = f"ping -c 3 -W 2 {src_ip}"
-                    logger.info(f"  Executing bash command: {reverse_ping_command}")
-                    
-                    reverse_ping_output = dest_device.bash_conn.execute(reverse_ping_command, timeout=10)
-                    
-                    # Check if reverse ping was successful
-                    if "3 received" in reverse_ping_output or "0% packet loss" in reverse_ping_output:
-                        logger.info(f"  ✓ Reverse bash ping successful: {dst_device} -> {src_device}")
-                    else:
-                        logger.error(f"  ✗ Reverse bash ping failed: {dst_device} -> {src_device}")
-                        logger.error(f"  Reverse ping output: {reverse_ping_output}")
-                        ping_test_passed = False
-                        
-                except Exception as reverse_ping_error:
-                    logger.error(f"  ✗ Reverse bash ping command failed: {dst_device} -> {src_device}: {reverse_ping_error}")
-                    ping_test_passed = False
-                    
-            except Exception as e:
-                logger.error(f"  ✗ Failed to test bash connectivity {src_device} <-> {dst_device}: {str(e)}")
-                ping_test_passed = False
+        # One multi-line record per device batch instead of one per ping
+        for batch in batches:
+            level = logging.INFO if all(result.ok for result in batch) else logging.ERROR
+            if logger.isEnabledFor(level):
+                logger.log(level, "\n".join(
+                    f"  {'✓' if result.ok else '✗'} Bash ping {result.path}: {result.detail}"
+                    for result in batch
+                ))
         
-        if ping_test_passed:
-            self.passed("Bash ping testing completed successfully")
+        failed = [result for result in results if not result.ok]
+        if failed:
+            self.failed("Some bash ping tests failed:\n" + "\n".join(f"{r.path}: {r.detail}" for r in failed))
         else:
-            self.failed("Some bash ping tests failed")
+            self.passed(f"Bash ping testing completed successfully - {len(results)} pings")
+    
+    def _bash_execute(self, device_name, command, operation='exec_ping'):
+        """Execute a command on a device's bash session
+
+        Only the worker pinging from this device uses its session, so no
+        locking is needed.
+        """
+        device = self._bash_devices[device_name]
+        return device.bash_conn.execute(command, timeout=_get_timeout(device, operation))
+    
+    def _ping_targets(self, device_name, targets):
+        """Ping a batch of (src_ip, dst_ip, dst_device) targets from one device - returns PingResults"""
+        def result(target, ok, detail):
+            src_ip, dst_ip, dst_device = target
+            return PingResult(device_name, src_ip, dst_device, dst_ip, ok, detail)
+        
+        if device_name not in self._bash_devices:
+            return [result(target, False, "no bash session (setup failed)") for target in targets]
+        
+        dst_ips = [dst_ip for src_ip, dst_ip, dst_device in targets]
+        
+        # A single fping round-trip covers every destination of this device.
+        # When fping is missing the linux plugin raises on "command not found",
+        # so any failure here just means falling back to plain ping
+        fping_command = f"fping -c1 -t1000 -q {' '.join(dst_ips)} 2>&1"
+        try:
+            fping_output = self._bash_execute(device_name, fping_command)
+        except Exception:
+            fping_output = ''
+        
+        counts = {ip: (int(sent), int(received)) for ip, sent, received in _FPING_RESULT.findall(fping_output)}
+        if counts:
+            results = []
+            for target in targets:
+                dst_ip = target[1]
+                if dst_ip not in counts:
+                    results.append(result(target, False, "no fping result"))
+                    continue
+                sent, received = counts[dst_ip]
+                results.append(result(target, received > 0, f"sent={sent}, received={received}"))
+            return results
+        
+        # fping is not available on the device - fall back to one ping per target;
+        # outcomes are logged by the test as one record per batch
+        results = []
+        for target in targets:
+            dst_ip = target[1]
+            ping_command = f"ping -c 1 -W 1 {dst_ip}"
+            try:
+                ping_output = self._bash_execute(device_name, ping_command)
+                summary = _parse_ping_summary(ping_output)
+                if summary is None:
+                    results.append(result(target, False, "ping fallback: no ping summary"))
+                else:
+                    sent, received, loss = summary
+                    results.append(result(target, received > 0,
+                                          f"ping fallback: sent={sent}, received={received}, loss={loss}%"))
+            except Exception as ping_error:
+                results.append(result(target, False, f"ping fallback: command failed: {ping_error}"))
+        return results
+    
+    @aetest.cleanup
+    def cleanup(self):
+        """Disconnect the bash sessions opened in setup"""
+        if not hasattr(self, '_bash_devices'):
+            self.skipped("no bash sessions were opened")
         
-        # Cleanup: Disconnect all devices
         logger.info("Cleaning up bash connection devices...")
-        for device_name, device in self.testbed.devices.items():
+        for device_name, device in self._bash_devices.items():
             try:
-                if hasattr(device, 'bash_conn') and device.bash_conn.connected:
-                    device.bash_conn.disconnect()
-                    logger.info(f"  Disconnected bash connection from {device_name}")
+                device.bash_conn.disconnect()
+                logger.info("  Disconnected bash connection from %s", device_name)
             except Exception as e:
-                logger.warning(f"  Failed to disconnect bash connection from {device_name}: {e}")
+                if device.bash_conn.connected:
+                    logger.warning("  Failed to disconnect bash connection from %s: %s", device_name, e)
+
 
 class CommonCleanup(aetest.CommonCleanup):
     """Common cleanup tasks"""
@@ -319,29 +522,9 @@ class CommonCleanup(aetest.CommonCleanup):
     def cleanup(self):
         """Cleanup after all tests"""
         logger.info(banner("Cleaning up test environment"))
-        # Add any cleanup tasks here
-
-if __name__ == '__main__':
-    # Run the test
-    import argparse
-    import sys
-    
-    parser = argparse.ArgumentParser(description='SONiC Network Test Script')
-    parser.add_argument('--testbed', '-t', 
-                       help='Path to testbed YAML file',
-                       default='testbed.yaml')
-    
-    args = parser.parse_args()
-    
-    # For standalone execution without testbed file
-    if len(sys.argv) == 1:
-        logger.info("Running basic test without testbed file")
-        aetest.main()
-    else:
-        # Load testbed object from YAML file
-        logger.info(f"Loading testbed from: {args.testbed}")
-        testbed_obj = loader.load(args.testbed)
-        logger.info(f"Testbed loaded with {len(testbed_obj.devices)} devices")
-        
-        # Run with testbed object
-        aetest.main(testbed=testbed_obj)
+        
+        # Drop cached command output so a rerun against the same testbed
+        # object doesn't see stale data
+        for device_name, device in CTX.devices:
+            if hasattr(device, '_cached_show_version'):
+                del device._cached_show_version
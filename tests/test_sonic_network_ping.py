@@ -0,0 +1,91 @@
+"""
+Offline checks for SonicBashPingTest._ping_targets using mocked bash sessions
+"""
+from types import SimpleNamespace
+from unittest import mock
+
+from unicon.core.errors import SubCommandFailure
+
+from sonic_network_test import PING_TARGETS, SonicBashPingTest, _parse_ping_summary
+
+PING_OK = """PING 192.1.2.12 (192.1.2.12) 56(84) bytes of data.
+64 bytes from 192.1.2.12: icmp_seq=1 ttl=64 time=0.045 ms
+
+--- 192.1.2.12 ping statistics ---
+1 packets transmitted, 1 received, 0% packet loss, time 0ms
+"""
+
+PING_LOST = """PING 192.1.5.15 (192.1.5.15) 56(84) bytes of data.
+
+--- 192.1.5.15 ping statistics ---
+1 packets transmitted, 0 received, 100% packet loss, time 0ms
+"""
+
+# iputils output when the destination is unreachable (ARP failed)
+PING_ERRORS = """PING 192.1.5.15 (192.1.5.15) 56(84) bytes of data.
+From 192.1.5.11 icmp_seq=1 Destination Host Unreachable
+
+--- 192.1.5.15 ping statistics ---
+1 packets transmitted, 0 received, +1 errors, 100% packet loss, time 0ms
+"""
+
+FPING_OUTPUT = """192.1.2.12 : xmt/rcv/%loss = 1/1/0%, min/avg/max = 0.05/0.05/0.05
+192.1.5.15 : xmt/rcv/%loss = 1/0/100%
+"""
+
+
+def _ping_targets(execute, devices=('sonic-1',)):
+    """Run _ping_targets for sonic-1 against a mocked bash_conn.execute"""
+    device = SimpleNamespace(
+        custom={'timeouts': {'exec_ping': 5}},
+        bash_conn=SimpleNamespace(execute=execute),
+    )
+    testcase = SimpleNamespace(_bash_devices={name: device for name in devices})
+    testcase._bash_execute = lambda *args, **kwargs: SonicBashPingTest._bash_execute(testcase, *args, **kwargs)
+    return SonicBashPingTest._ping_targets(testcase, 'sonic-1', PING_TARGETS['sonic-1'])
+
+
+def test_parse_ping_summary():
+    assert _parse_ping_summary(PING_OK) == (1, 1, 0)
+    assert _parse_ping_summary(PING_LOST) == (1, 0, 100)
+    assert _parse_ping_summary(PING_ERRORS) == (1, 0, 100)
+    # Summary split across lines by the terminal still parses
+    assert _parse_ping_summary(PING_OK.replace(' 0% packet loss', '\r\n0% packet loss')) == (1, 1, 0)
+    assert _parse_ping_summary("bash: ping: command not found") is None
+
+
+def test_fping_batch():
+    execute = mock.Mock(return_value=FPING_OUTPUT)
+
+    results = _ping_targets(execute)
+
+    assert execute.call_count == 1
+    assert [(r.dst, r.dst_ip, r.ok) for r in results] == [
+        ('sonic-2', '192.1.2.12', True),
+        ('sonic-5', '192.1.5.15', False),
+    ]
+
+
+def test_falls_back_to_ping_when_fping_missing():
+    def execute(command, timeout):
+        if command.startswith('fping'):
+            # What unicon's linux plugin raises on "command not found"
+            raise SubCommandFailure('sub_command failure, patterns matched in the output:',
+                                    ['^.*?command not found'])
+        return PING_OK if '192.1.2.12' in command else PING_LOST
+
+    results = _ping_targets(mock.Mock(side_effect=execute))
+
+    assert [(r.dst_ip, r.ok, r.detail) for r in results] == [
+        ('192.1.2.12', True, 'ping fallback: sent=1, received=1, loss=0%'),
+        ('192.1.5.15', False, 'ping fallback: sent=1, received=0, loss=100%'),
+    ]
+
+
+def test_missing_bash_session():
+    execute = mock.Mock()
+
+    results = _ping_targets(execute, devices=())
+
+    execute.assert_not_called()
+    assert all(not r.ok and r.detail == 'no bash session (setup failed)' for r in results)